@@ -23,14 +23,35 @@ const long long max_size = 2000;         // max length of strings
 const long long N = 1;                   // number of closest words
 const long long max_w = 50;              // max length of vocabulary entries
 
+char *vocab;
+long long words, *vocab_hash, vocab_hash_size;
+
+// Returns hash value of a word
+long long GetWordHash(char *word) {
+  unsigned long long a, hash = 0;
+  for (a = 0; word[a]; a++) hash = hash * 257 + word[a];
+  hash = hash % vocab_hash_size;
+  return hash;
+}
+
+// Returns position of a word in the vocabulary; if the word is not found, returns words
+long long SearchVocab(char *word) {
+  long long hash = GetWordHash(word);
+  while (1) {
+    if (vocab_hash[hash] == -1) return words;
+    if (!strcmp(word, &vocab[vocab_hash[hash] * max_w])) return vocab_hash[hash];
+    hash = (hash + 1) % vocab_hash_size;
+  }
+  return words;
+}
+
 int main(int argc, char **argv)
 {
   FILE *f;
   char st1[max_size], st2[max_size], st3[max_size], st4[max_size], bestw[N][max_size], file_name[max_size], ch;
   float dist, len, bestd[N], vec[max_size];
-  long long words, size, a, b, c, d, b1, b2, b3, threshold = 0;
+  long long size, a, b, c, d, b1, b2, b3, hash, threshold = 0;
   float *M;
-  char *vocab;
   int TCN, CCN = 0, TACN = 0, CACN = 0, SECN = 0, SYCN = 0, SEAC = 0, SYAC = 0, QID = 0, TQ = 0, TQS = 0;
   if (argc < 2) {
     printf("Usage: ./compute-accuracy <FILE> <threshold>\nwhere FILE contains word projections, and threshold is used to reduce vocabulary of the model for fast approximate evaluation (0 = off, otherwise typical value is 30000)\n");
@@ -68,12 +89,24 @@ int main(int argc, char **argv)
     for (a = 0; a < size; a++) M[a + b * size] /= len;
   }
   fclose(f);
+  // Index the vocabulary; upper-casing can produce duplicates, the first occurrence wins
+  vocab_hash_size = words * 2 + 1;
+  vocab_hash = (long long *)malloc(vocab_hash_size * sizeof(long long));
+  for (a = 0; a < vocab_hash_size; a++) vocab_hash[a] = -1;
+  for (b = 0; b < words; b++) {
+    hash = GetWordHash(&vocab[b * max_w]);
+    while (vocab_hash[hash] != -1) {
+      if (!strcmp(&vocab[b * max_w], &vocab[vocab_hash[hash] * max_w])) break;
+      hash = (hash + 1) % vocab_hash_size;
+    }
+    if (vocab_hash[hash] == -1) vocab_hash[hash] = b;
+  }
   TCN = 0;
   while (1) {
     for (a = 0; a < N; a++) bestd[a] = 0;
     for (a = 0; a < N; a++) bestw[a][0] = 0;
     scanf("%s", st1);
-    for (a = 0; a < strlen(st1); a++) st1[a] = toupper(st1[a]);
+    for (a = 0; st1[a]; a++) st1[a] = toupper(st1[a]);
     if ((!strcmp(st1, ":")) || (!strcmp(st1, "EXIT")) || feof(stdin)) {
       if (TCN == 0) TCN = 1;
       if (QID != 0) {
@@ -90,24 +123,21 @@ int main(int argc, char **argv)
     }
     if (!strcmp(st1, "EXIT")) break;
     scanf("%s", st2);
-    for (a = 0; a < strlen(st2); a++) st2[a] = toupper(st2[a]);
+    for (a = 0; st2[a]; a++) st2[a] = toupper(st2[a]);
     scanf("%s", st3);
-    for (a = 0; a<strlen(st3); a++) st3[a] = toupper(st3[a]);
+    for (a = 0; st3[a]; a++) st3[a] = toupper(st3[a]);
     scanf("%s", st4);
-    for (a = 0; a < strlen(st4); a++) st4[a] = toupper(st4[a]);
-    for (b = 0; b < words; b++) if (!strcmp(&vocab[b * max_w], st1)) break;
-    b1 = b;
-    for (b = 0; b < words; b++) if (!strcmp(&vocab[b * max_w], st2)) break;
-    b2 = b;
-    for (b = 0; b < words; b++) if (!strcmp(&vocab[b * max_w], st3)) break;
-    b3 = b;
+    for (a = 0; st4[a]; a++) st4[a] = toupper(st4[a]);
+    b1 = SearchVocab(st1);
+    b2 = SearchVocab(st2);
+    b3 = SearchVocab(st3);
     for (a = 0; a < N; a++) bestd[a] = 0;
     for (a = 0; a < N; a++) bestw[a][0] = 0;
     TQ++;
     if (b1 == words) continue;
     if (b2 == words) continue;
     if (b3 == words) continue;
-    for (b = 0; b < words; b++) if (!strcmp(&vocab[b * max_w], st4)) break;
+    b = SearchVocab(st4);
     if (b == words) continue;
     for (a = 0; a < size; a++) vec[a] = (M[a + b2 * size] - M[a + b1 * size]) + M[a + b3 * size];
     TQS++;
@@ -25,6 +25,7 @@
 #define MAX_CODE_LENGTH 40
 
 const int vocab_hash_size = 30000000;  // Maximum 30 * 0.7 = 21M words in the vocabulary
+const int output_buffer_size = 1 << 20; // Size of the write buffer for the output file
 
 typedef float real;                    // Precision of float numbers
 
@@ -544,6 +545,7 @@ void *TrainModelThread(void *id) {
 void TrainModel() {
   long a, b, c, d;
   FILE *fo;
+  char *fo_buf;
   pthread_t *pt = (pthread_t *)malloc(num_threads * sizeof(pthread_t));
   printf("Starting training using file %s\n", train_file);
   starting_alpha = alpha;
@@ -556,12 +558,14 @@ void TrainModel() {
   for (a = 0; a < num_threads; a++) pthread_create(&pt[a], NULL, TrainModelThread, (void *)a);
   for (a = 0; a < num_threads; a++) pthread_join(pt[a], NULL);
   fo = fopen(output_file, "wb");
+  fo_buf = (char *)malloc(output_buffer_size);
+  setvbuf(fo, fo_buf, _IOFBF, output_buffer_size);
   if (classes == 0) {
     // Save the word vectors
     fprintf(fo, "%lld %lld\n", vocab_size, layer1_size);
     for (a = 0; a < vocab_size; a++) {
       fprintf(fo, "%s ", vocab[a].word);
-      if (binary) for (b = 0; b < layer1_size; b++) fwrite(&syn0[a * layer1_size + b], sizeof(real), 1, fo);
+      if (binary) fwrite(&syn0[a * layer1_size], sizeof(real), layer1_size, fo);
       else for (b = 0; b < layer1_size; b++) fprintf(fo, "%lf ", syn0[a * layer1_size + b]);
       fprintf(fo, "\n");
     }
@@ -610,6 +614,7 @@ void TrainModel() {
     free(cl);
   }
   fclose(fo);
+  free(fo_buf);
 }
 
 int ArgPos(char *str, int argc, char **argv) {
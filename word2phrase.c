@@ -21,6 +21,7 @@
 #define MAX_STRING 60
 
 const int vocab_hash_size = 500000000; // Maximum 500M entries in the vocabulary
+const int output_buffer_size = 1 << 20; // Size of the write buffer for the output file
 
 typedef float real;                    // Precision of float numbers
 
@@ -208,10 +209,13 @@ void TrainModel() {
   char word[MAX_STRING], last_word[MAX_STRING], bigram_word[MAX_STRING * 2];
   real score;
   FILE *fo, *fin;
+  char *fo_buf;
   printf("Starting training using file %s\n", train_file);
   LearnVocabFromTrainFile();
   fin = fopen(train_file, "rb");
   fo = fopen(output_file, "wb");
+  fo_buf = (char *)malloc(output_buffer_size);
+  setvbuf(fo, fo_buf, _IOFBF, output_buffer_size);
   word[0] = 0;
   while (1) {
     strcpy(last_word, word);
@@ -245,6 +249,7 @@ void TrainModel() {
     pa = pb;
   }
   fclose(fo);
+  free(fo_buf);
   fclose(fin);
 }
 